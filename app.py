@@ -4,15 +4,12 @@ from faulthandler import disable
 import streamlit as st
 import pandas as pd
 import os
-import tempfile
 from io import BytesIO
 import base64
 from pathlib import Path
 
 os.environ['YDATA_LICENSE_KEY'] = '74ff0c2a-ae55-41ba-bb00-976bee030b68'
 
-from ydata.connectors import LocalConnector
-from ydata.dataset.filetype import FileType
 from ydata.dataset import Dataset
 from ydata.metadata import Metadata
 from ydata.synthesizers.regular.model import RegularSynthesizer
@@ -20,6 +17,8 @@ from ydata.profiling import ProfileReport
 
 from streamlit.components import v1 as components
 
+from data_loading import read_compact_csv
+
 # Page config
 st.set_page_config(
     page_title="YData Synthetic Data Generator",
@@ -28,7 +27,6 @@ st.set_page_config(
 )
 
 #Init session state variables
-st.session_state.setdefault("real_data_path", None)
 st.session_state.setdefault("metadata_path", None)
 st.session_state.setdefault("synthetic_data", None)
 
@@ -37,10 +35,9 @@ st.session_state.setdefault("quality_report", None)
 st.session_state.setdefault("quality_report_bytes", None)
 
 @st.cache_data
-def load_data(path: str) -> Dataset:
-    connector = LocalConnector()
-    data = connector.read_file(path=path, file_type=FileType.CSV)
-    st.session_state.real_data_path = path
+def load_data(df: pd.DataFrame) -> Dataset:
+    # Dataset casts columns back to its own int/string dtypes
+    data = Dataset(df)
     return data
 
 @st.cache_data
@@ -153,8 +150,8 @@ with col1:
     )
 
 if uploaded_file is not None:
-    # Read the uploaded file
-    df = pd.read_csv(uploaded_file)
+    # Read the uploaded file with compact dtypes (categories, downcast integers)
+    df = read_compact_csv(uploaded_file)
     
     with col2:
         st.markdown('<h3 class="sub-header">📊 Data Preview</h3>', unsafe_allow_html=True)
@@ -221,13 +218,8 @@ if uploaded_file is not None:
         if st.button("🚀 Train Model & Generate Synthetic Data", width='stretch'):
             with st.spinner("Training model... This may take a few minutes."):
                 try:
-                    # Save uploaded file to temp location
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp_file:
-                        uploaded_file.seek(0)
-                        tmp_file.write(uploaded_file.getvalue())
-                        tmp_path = tmp_file.name
-
-                    data = load_data(tmp_path)
+                    # Reuse the compact frame from the preview
+                    data = load_data(df)
 
                     # Create synthesizer and metadata
                     synth = RegularSynthesizer()
@@ -263,9 +255,6 @@ if uploaded_file is not None:
                                                 metadata=metadata,
                                                 target_col=target_col)
 
-                    # Cleanup temp file
-                    os.unlink(tmp_path)
-
                     st.success(f"✅ Successfully generated {len(synth_sample):,} synthetic records!")
 
                 except Exception as e:
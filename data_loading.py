@@ -0,0 +1,34 @@
+"""Load CSV data with compact dtypes."""
+import numpy as np
+import pandas as pd
+
+# Text columns are stored as categories when their distinct values stay under both limits
+CATEGORY_MAX_UNIQUE = 1000
+CATEGORY_MAX_UNIQUE_RATIO = 0.05
+
+# YData's Dataset does not map int8, so integers are never downcast below int16
+MIN_INT_DTYPE = np.dtype('int16')
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Dictionary-encode low-cardinality text columns and downcast integer columns, in place"""
+    max_unique = min(CATEGORY_MAX_UNIQUE, CATEGORY_MAX_UNIQUE_RATIO * len(df))
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            if series.nunique(dropna=True) <= max_unique:
+                df[col] = series.astype('category')
+        elif pd.api.types.is_integer_dtype(series):
+            series = pd.to_numeric(series, downcast='integer')
+            if series.dtype.itemsize < MIN_INT_DTYPE.itemsize:
+                series = series.astype(MIN_INT_DTYPE)
+            df[col] = series
+    return df
+
+
+def read_compact_csv(filepath_or_buffer) -> pd.DataFrame:
+    """Read a CSV file (path or file-like object) into a DataFrame with compact dtypes"""
+    df = pd.read_csv(filepath_or_buffer, encoding_errors='ignore')
+    # Same as LocalConnector: drop the index column written by DataFrame.to_csv
+    df = df.drop(columns='Unnamed: 0', errors='ignore')
+    return compact_dtypes(df)
@@ -0,0 +1,62 @@
+"""Tests for data_loading."""
+from io import StringIO
+
+import pandas as pd
+import pytest
+
+from data_loading import CATEGORY_MAX_UNIQUE, read_compact_csv
+
+
+def to_csv_buffer(df: pd.DataFrame, index: bool = False) -> StringIO:
+    buffer = StringIO()
+    df.to_csv(buffer, index=index)
+    buffer.seek(0)
+    return buffer
+
+
+def test_integers_never_below_int16():
+    df = read_compact_csv(to_csv_buffer(pd.DataFrame({
+        "small": [1, 2, 3] * 10,
+        "large": [100_000, 200_000, 300_000] * 10,
+    })))
+    assert df["small"].dtype == "int16"
+    assert df["large"].dtype == "int32"
+
+
+def test_unnamed_index_column_is_dropped():
+    df = read_compact_csv(to_csv_buffer(pd.DataFrame({"a": [1, 2, 3]}), index=True))
+    assert list(df.columns) == ["a"]
+
+
+def test_text_categorised_only_under_both_limits():
+    n_rows = 40_000
+    df = read_compact_csv(to_csv_buffer(pd.DataFrame({
+        # 10 distinct values: under both limits
+        "low": [f"v{i % 10}" for i in range(n_rows)],
+        # 1500 distinct values: under the 5% ratio, over the absolute cap
+        "over_cap": [f"v{i % (CATEGORY_MAX_UNIQUE + 500)}" for i in range(n_rows)],
+        # every value distinct: over both limits
+        "free_text": [f"v{i}" for i in range(n_rows)],
+    })))
+    assert isinstance(df["low"].dtype, pd.CategoricalDtype)
+    assert df["over_cap"].dtype == object
+    assert df["free_text"].dtype == object
+
+
+def test_text_over_ratio_not_categorised():
+    # 10 distinct values in 20 rows: under the absolute cap, over the 5% ratio
+    df = read_compact_csv(to_csv_buffer(pd.DataFrame({"a": [f"v{i % 10}" for i in range(20)]})))
+    assert df["a"].dtype == object
+
+
+def test_dataset_matches_plain_read_csv():
+    Dataset = pytest.importorskip("ydata.dataset").Dataset
+
+    raw = pd.DataFrame({
+        "STATE": [1, 2, 4] * 20,
+        "STATENAME": ["Alabama", "Alaska", "Arizona"] * 20,
+        "ST_CASE": range(10_001, 10_061),
+    })
+    compact = Dataset(read_compact_csv(to_csv_buffer(raw))).to_pandas()
+    plain = Dataset(pd.read_csv(to_csv_buffer(raw))).to_pandas()
+    pd.testing.assert_frame_equal(compact, plain)